@@ -1,49 +1,69 @@
 """Configuration management for the bot."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml-backed, much faster
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 # Base paths (module-level, not config)
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
+CONFIG_PATH = PROJECT_ROOT / "config.yaml"
 
 # Load .env once at module import
 load_dotenv(PROJECT_ROOT / ".env")
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
-    """Application configuration (settings that affect behavior)."""
+    """Application configuration (settings that affect behavior).
+    
+    Loaded once per process and immutable at runtime.
+    """
     
     # Common Voice API
     cv_api_base_url: str
     token_expiry_buffer_seconds: int
     
-    # Languages
-    supported_languages: dict[str, str]
+    # Languages (read-only; codes precomputed for membership checks)
+    supported_languages: Mapping[str, str]
+    supported_codes: frozenset[str]
     
     # Sentence limits
     max_sentences: int
     default_sentences: int
 
 
+def _read_yaml_config() -> dict:
+    """Parse config.yaml (libyaml-backed when available)."""
+    with open(CONFIG_PATH) as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from config.yaml."""
-    # Ensure data directory exists
+    """Load configuration from config.yaml (cached: repeat calls return the same instance)."""
+    # Ensure data directory exists (runs once, since the result is cached)
     DATA_DIR.mkdir(exist_ok=True)
     
-    # Load config.yaml
-    with open(PROJECT_ROOT / "config.yaml") as f:
-        yaml_config = yaml.safe_load(f)
+    yaml_config = _read_yaml_config()
+    languages = MappingProxyType(dict(yaml_config["languages"]))
     
     return Config(
         cv_api_base_url=yaml_config["cv_api"]["base_url"],
         token_expiry_buffer_seconds=yaml_config["cv_api"]["token_expiry_buffer_seconds"],
-        supported_languages=yaml_config["languages"],
+        supported_languages=languages,
+        supported_codes=frozenset(languages),
         max_sentences=yaml_config["sentences"]["max"],
         default_sentences=yaml_config["sentences"]["default"],
     )
@@ -1,33 +1,76 @@
 """Supabase database operations for the bot."""
 
 import os
-import logging
+import time
 import asyncio
-from datetime import datetime, timezone
+import logging
 from typing import Optional
 
-from supabase import create_client, Client
+from supabase import acreate_client, AsyncClient
 
 logger = logging.getLogger(__name__)
 
+# Column lists for the rows handlers read (avoids shipping unused columns)
+_USER_COLUMNS = "telegram_id, cv_user_id, email, username, cv_token, current_language, age, gender"
+_SENTENCE_COLUMNS = "id, sentence_number, text_id, text, hash"
+_RECORDING_COLUMNS = "sentence_id, file_id, storage_path, status, error_message"
+
+# Bot language is read on nearly every update but rarely changes
+_BOT_LANGUAGE_CACHE_TTL_SECONDS = 300
+_BOT_LANGUAGE_CACHE_MAX_ENTRIES = 10_000
+
+
+def _embedded_recording(sentence: dict) -> Optional[dict]:
+    """Get the recording embedded in a sentence row, or None.
+
+    recordings.sentence_id is unique, so PostgREST embeds it as a single
+    object; older PostgREST versions return a one-element list instead.
+    """
+    recording = sentence.get("recordings")
+    if isinstance(recording, list):
+        return recording[0] if recording else None
+    return recording
+
 
 class Database:
     """Supabase database operations."""
     
     def __init__(self):
-        url = os.getenv("SUPABASE_URL")
-        key = os.getenv("SUPABASE_KEY")
-        if not url or not key:
+        self._url = os.getenv("SUPABASE_URL")
+        self._key = os.getenv("SUPABASE_KEY")
+        if not self._url or not self._key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment")
-        self.client: Client = create_client(url, key)
+        self.client: Optional[AsyncClient] = None
+        # telegram_id -> (bot_language, expires_at monotonic time)
+        self._bot_language_cache: dict[int, tuple[str, float]] = {}
     
     async def init(self) -> None:
-        """Initialize database connection. Tables are managed via Supabase SQL Editor."""
+        """Initialize database connection. Tables are managed via Supabase SQL Editor.
+        
+        A single async client is shared by every query so its HTTP connection
+        pool stays warm and no query pays a worker-thread hop.
+        """
+        if self.client is None:
+            self.client = await acreate_client(self._url, self._key)
         logger.info("Database initialized (Supabase)")
 
-    def _now(self) -> str:
-        """Get current UTC timestamp in ISO format."""
-        return datetime.now(timezone.utc).isoformat()
+    async def close(self) -> None:
+        """Close the shared client's HTTP connections (PostgREST and Storage).
+        
+        Each close is attempted even if another fails, so shutdown can continue.
+        """
+        if self.client is None:
+            return
+        # storage3 has no stable aclose(); its httpx session does
+        for name, aclose in (
+            ("postgrest", self.client.postgrest.aclose),
+            ("storage", self.client.storage.session.aclose),
+        ):
+            try:
+                await aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close Supabase {name} client: {e}")
+        self.client = None
 
     # ==========================================
     # User operations
@@ -40,45 +83,40 @@ class Database:
         email: str,
         username: str,
     ) -> None:
-        """Save or update a CV account and mark it as the active account for this telegram_id."""
-        now = self._now()
-
-        # Deactivate any currently active account for this telegram_id
-        await asyncio.to_thread(
-            lambda: self.client.table("users").update({
-                "cv_token": None,
-                "current_language": None,
-                "updated_at": now,
-            }).eq("telegram_id", telegram_id).eq("cv_token", "active").execute()
-        )
-
-        # Upsert the account (keyed by username). created_at is left to DB default on insert.
-        data = {
-            "telegram_id": telegram_id,
-            "cv_user_id": cv_user_id,
-            "email": email,
-            "username": username,
-            "cv_token": "active",
-            "updated_at": now,
-        }
-        await asyncio.to_thread(
-            lambda: self.client.table("users").upsert(data, on_conflict="username").execute()
-        )
+        """Save or update a CV account and mark it as the active account for this telegram_id.
+        
+        Deactivating the previous account and upserting this one (keyed by username)
+        run server-side in one transaction, so a failure never leaves no active account.
+        """
+        await self.client.rpc("login_user", {
+            "p_telegram_id": telegram_id,
+            "p_cv_user_id": cv_user_id,
+            "p_email": email,
+            "p_username": username,
+        }).execute()
 
     async def get_user(self, telegram_id: int) -> Optional[dict]:
         """Get the active account for a telegram ID."""
-        result = await asyncio.to_thread(
-            lambda: self.client.table("users").select("*")
+        result = await (
+            self.client.table("users").select(_USER_COLUMNS)
                 .eq("telegram_id", telegram_id)
                 .eq("cv_token", "active")
                 .execute()
         )
         return result.data[0] if result.data else None
 
+    async def get_language_and_user(self, telegram_id: int) -> tuple[str, Optional[dict]]:
+        """Get bot language and active account together (independent reads, run concurrently)."""
+        lang, user = await asyncio.gather(
+            self.get_bot_language(telegram_id),
+            self.get_user(telegram_id),
+        )
+        return lang, user
+
     async def get_user_by_username(self, username: str) -> Optional[dict]:
         """Get user by username (includes email and telegram_id for ownership verification)."""
-        result = await asyncio.to_thread(
-            lambda: self.client.table("users")
+        result = await (
+            self.client.table("users")
                 .select("telegram_id, cv_user_id, username, email")
                 .eq("username", username)
                 .execute()
@@ -86,43 +124,22 @@ class Database:
         return result.data[0] if result.data else None
 
     async def delete_user(self, telegram_id: int) -> None:
-        """Delete all accounts for a telegram ID and their preferences."""
-        await asyncio.to_thread(
-            lambda: self.client.table("user_preferences").delete().eq("telegram_id", telegram_id).execute()
-        )
-        await asyncio.to_thread(
-            lambda: self.client.table("users").delete().eq("telegram_id", telegram_id).execute()
-        )
+        """Delete all accounts for a telegram ID and their preferences (one transaction)."""
+        await self.client.rpc("delete_user", {"p_telegram_id": telegram_id}).execute()
+        self._bot_language_cache.pop(telegram_id, None)
 
     async def logout_user(self, telegram_id: int, cv_user_id: str) -> None:
-        """Log out user by clearing token, current language, and active sentences."""
-        now = self._now()
-        
-        # Clear all active sentences for this user
-        await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .delete()
-                .eq("cv_user_id", cv_user_id)
-                .eq("status", "active")
-                .execute()
-        )
-        
-        # Clear active account session
-        await asyncio.to_thread(
-            lambda: self.client.table("users").update({
-                "cv_token": None,
-                "current_language": None,
-                "updated_at": now,
-            }).eq("telegram_id", telegram_id).eq("cv_token", "active").execute()
-        )
+        """Log out user by clearing token, current language, and active sentences (one transaction)."""
+        await self.client.rpc("logout_user", {
+            "p_telegram_id": telegram_id,
+            "p_cv_user_id": cv_user_id,
+        }).execute()
 
     async def set_current_language(self, telegram_id: int, language: str) -> None:
         """Set the current recording language for the active account."""
-        now = self._now()
-        await asyncio.to_thread(
-            lambda: self.client.table("users").update({
+        await (
+            self.client.table("users").update({
                 "current_language": language,
-                "updated_at": now,
             }).eq("telegram_id", telegram_id).eq("cv_token", "active").execute()
         )
 
@@ -133,12 +150,10 @@ class Database:
         gender: Optional[str],
     ) -> None:
         """Update demographic info on the active account."""
-        now = self._now()
-        await asyncio.to_thread(
-            lambda: self.client.table("users").update({
+        await (
+            self.client.table("users").update({
                 "age": age,
                 "gender": gender,
-                "updated_at": now,
             }).eq("telegram_id", telegram_id).eq("cv_token", "active").execute()
         )
 
@@ -147,72 +162,67 @@ class Database:
     # ==========================================
 
     async def get_bot_language(self, telegram_id: int) -> str:
-        """Get bot interface language from user preferences."""
-        result = await asyncio.to_thread(
-            lambda: self.client.table("user_preferences")
+        """Get bot interface language from user preferences (cached in-process)."""
+        cached = self._bot_language_cache.get(telegram_id)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        result = await (
+            self.client.table("user_preferences")
                 .select("bot_language")
                 .eq("telegram_id", telegram_id)
                 .execute()
         )
-        if result.data:
-            return result.data[0]["bot_language"]
-        return "es"
+        language = result.data[0]["bot_language"] if result.data else "es"
+        self._cache_bot_language(telegram_id, language)
+        return language
 
     async def set_bot_language(self, telegram_id: int, language: str) -> None:
         """Set bot interface language in user preferences."""
-        now = self._now()
         data = {
             "telegram_id": telegram_id,
             "bot_language": language,
-            "updated_at": now,
         }
-        await asyncio.to_thread(
-            lambda: self.client.table("user_preferences").upsert(data, on_conflict="telegram_id").execute()
-        )
+        await self.client.table("user_preferences").upsert(data, on_conflict="telegram_id").execute()
+        self._cache_bot_language(telegram_id, language)
+
+    def _cache_bot_language(self, telegram_id: int, language: str) -> None:
+        """Remember a user's bot language until the TTL expires."""
+        if len(self._bot_language_cache) >= _BOT_LANGUAGE_CACHE_MAX_ENTRIES:
+            self._bot_language_cache.clear()
+        expires_at = time.monotonic() + _BOT_LANGUAGE_CACHE_TTL_SECONDS
+        self._bot_language_cache[telegram_id] = (language, expires_at)
 
     # ==========================================
     # Sentence operations
     # ==========================================
 
     async def save_sentences(self, cv_user_id: str, language: str, sentences: list[dict]) -> list[dict]:
-        """Save new sentences. Deletes ALL old active sentences first (across all languages)."""
-        now = self._now()
-        
-        # Delete ALL active sentences for this user (starting fresh session)
-        await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .delete()
-                .eq("cv_user_id", cv_user_id)
-                .eq("status", "active")
-                .execute()
-        )
+        """Save new sentences. Deletes ALL old active sentences first (across all languages).
         
-        # Insert new sentences
-        data = [
+        The delete and insert run server-side in one transaction (single round-trip).
+        """
+        rows = [
             {
-                "cv_user_id": cv_user_id,
-                "language": language,
                 "sentence_number": i,
                 "text_id": sentence["id"],
                 "text": sentence["text"],
                 "hash": sentence["hash"],
-                "status": "active",
-                "created_at": now,
             }
             for i, sentence in enumerate(sentences, start=1)
         ]
-        if data:
-            result = await asyncio.to_thread(
-                lambda: self.client.table("sentences").insert(data).execute()
-            )
-            return result.data
-        return []
+        result = await self.client.rpc("replace_active_sentences", {
+            "p_cv_user_id": cv_user_id,
+            "p_language": language,
+            "p_sentences": rows,
+        }).execute()
+        return result.data or []
 
     async def get_sentence_by_number(self, cv_user_id: str, language: str, sentence_number: int) -> Optional[dict]:
         """Get an active sentence by number."""
-        result = await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .select("*")
+        result = await (
+            self.client.table("sentences")
+                .select(_SENTENCE_COLUMNS)
                 .eq("cv_user_id", cv_user_id)
                 .eq("language", language)
                 .eq("sentence_number", sentence_number)
@@ -223,9 +233,9 @@ class Database:
 
     async def get_sentence_by_id(self, sentence_id: int) -> Optional[dict]:
         """Get a sentence by its ID."""
-        result = await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .select("*")
+        result = await (
+            self.client.table("sentences")
+                .select(_SENTENCE_COLUMNS)
                 .eq("id", sentence_id)
                 .execute()
         )
@@ -233,9 +243,9 @@ class Database:
 
     async def get_all_sentences(self, cv_user_id: str, language: str) -> list[dict]:
         """Get all active sentences for a CV user in a language."""
-        result = await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .select("*")
+        result = await (
+            self.client.table("sentences")
+                .select(_SENTENCE_COLUMNS)
                 .eq("cv_user_id", cv_user_id)
                 .eq("language", language)
                 .eq("status", "active")
@@ -245,48 +255,66 @@ class Database:
         return result.data
 
     async def get_sentence_count(self, cv_user_id: str, language: str, status: str = None) -> int:
-        """Get count of sentences. If status is None, count all sentences."""
+        """Get count of sentences. If status is None, count all sentences.
+        
+        Sent as a HEAD request: only the count header comes back, no rows.
+        """
         query = self.client.table("sentences") \
-            .select("id", count="exact") \
+            .select("id", count="exact", head=True) \
             .eq("cv_user_id", cv_user_id) \
             .eq("language", language)
         
         if status:
             query = query.eq("status", status)
         
-        result = await asyncio.to_thread(lambda: query.execute())
+        result = await query.execute()
         return result.count or 0
 
-    async def get_seen_sentence_ids(self, cv_user_id: str, language: str) -> set[str]:
-        """Get sentence IDs that have been uploaded or skipped (for deduplication)."""
-        result = await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .select("text_id")
+    async def has_sentences(self, cv_user_id: str, language: str) -> bool:
+        """Check whether any sentences (of any status) exist, without counting them."""
+        result = await (
+            self.client.table("sentences")
+                .select("id")
                 .eq("cv_user_id", cv_user_id)
                 .eq("language", language)
-                .in_("status", ["uploaded", "skipped"])
+                .limit(1)
                 .execute()
         )
-        return {row["text_id"] for row in result.data}
+        return bool(result.data)
 
-    async def mark_sentence_uploaded(self, sentence_id: int) -> None:
-        """Mark a sentence as uploaded."""
-        await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .update({"status": "uploaded"})
-                .eq("id", sentence_id)
-                .execute()
-        )
+    async def get_seen_sentence_ids(self, cv_user_id: str, language: str) -> set[str]:
+        """Get sentence IDs that have been uploaded or skipped (for deduplication).
+        
+        Aggregated server-side into a single array instead of one JSON object per row.
+        """
+        result = await self.client.rpc("seen_sentence_ids", {
+            "p_cv_user_id": cv_user_id,
+            "p_language": language,
+        }).execute()
+        return set(result.data or ())
 
     async def mark_sentence_skipped(self, sentence_id: int) -> None:
         """Mark a sentence as skipped."""
-        await asyncio.to_thread(
-            lambda: self.client.table("sentences")
+        await (
+            self.client.table("sentences")
                 .update({"status": "skipped"})
                 .eq("id", sentence_id)
                 .execute()
         )
 
+    async def mark_sentences_skipped(self, cv_user_id: str, language: str, sentence_numbers: list[int]) -> list[int]:
+        """Mark active sentences as skipped by number (one round-trip). Returns the numbers skipped."""
+        result = await (
+            self.client.table("sentences")
+                .update({"status": "skipped"})
+                .eq("cv_user_id", cv_user_id)
+                .eq("language", language)
+                .eq("status", "active")
+                .in_("sentence_number", sentence_numbers)
+                .execute()
+        )
+        return sorted(row["sentence_number"] for row in result.data)
+
     # ==========================================
     # Recording operations
     # ==========================================
@@ -294,18 +322,16 @@ class Database:
     async def save_recording(
         self, sentence_id: int, file_id: str, storage_path: Optional[str] = None,
     ) -> None:
-        """Save a recording for a sentence."""
-        now = self._now()
+        """Save a recording for a sentence. Timestamps are set by the DB."""
         data = {
             "sentence_id": sentence_id,
             "file_id": file_id,
             "status": "pending",
-            "created_at": now,
         }
         if storage_path:
             data["storage_path"] = storage_path
-        await asyncio.to_thread(
-            lambda: self.client.table("recordings")
+        await (
+            self.client.table("recordings")
                 .upsert(data, on_conflict="sentence_id")
                 .execute()
         )
@@ -315,180 +341,99 @@ class Database:
     ) -> str:
         """Upload audio to Supabase Storage and return the storage path."""
         storage_path = f"{cv_user_id}/{language}/{text_id}.ogg"
-        await asyncio.to_thread(
-            lambda: self.client.storage.from_("recordings").upload(
-                storage_path,
-                audio_bytes,
-                {"content-type": "audio/ogg", "upsert": "true"},
-            )
+        await self.client.storage.from_("recordings").upload(
+            storage_path,
+            audio_bytes,
+            {"content-type": "audio/ogg", "upsert": "true"},
         )
         return storage_path
 
     async def get_recording(self, sentence_id: int) -> Optional[dict]:
         """Get recording for a sentence."""
-        result = await asyncio.to_thread(
-            lambda: self.client.table("recordings")
-                .select("*")
+        result = await (
+            self.client.table("recordings")
+                .select(_RECORDING_COLUMNS)
                 .eq("sentence_id", sentence_id)
                 .execute()
         )
         return result.data[0] if result.data else None
 
-    async def get_pending_recordings(self, cv_user_id: str, language: str) -> list[dict]:
-        """Get all pending recordings for active sentences."""
-        sentences = await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .select("*")
+    async def _get_recordings_by_status(self, cv_user_id: str, language: str, status: str) -> list[dict]:
+        """Get recordings with the given status for active sentences, merged with sentence fields."""
+        # Inner-join recordings onto sentences server-side (one round-trip)
+        result = await (
+            self.client.table("sentences")
+                .select(f"{_SENTENCE_COLUMNS}, recordings!inner({_RECORDING_COLUMNS})")
                 .eq("cv_user_id", cv_user_id)
                 .eq("language", language)
                 .eq("status", "active")
+                .eq("recordings.status", status)
                 .order("sentence_number")
                 .execute()
         )
         
-        if not sentences.data:
-            return []
-        
-        sentence_ids = [s["id"] for s in sentences.data]
-        recordings = await asyncio.to_thread(
-            lambda: self.client.table("recordings")
-                .select("*")
-                .in_("sentence_id", sentence_ids)
-                .eq("status", "pending")
-                .execute()
-        )
-        
-        recording_map = {r["sentence_id"]: r for r in recordings.data}
-        result = []
-        for s in sentences.data:
-            r = recording_map.get(s["id"])
-            if r:
-                result.append({
-                    **r,
-                    "sentence_number": s["sentence_number"],
-                    "text_id": s["text_id"],
-                    "text": s["text"],
-                    "hash": s["hash"],
-                })
-        return result
+        recordings = []
+        for s in result.data:
+            r = _embedded_recording(s)
+            r.update(
+                sentence_number=s["sentence_number"],
+                text_id=s["text_id"],
+                text=s["text"],
+                hash=s["hash"],
+            )
+            recordings.append(r)
+        return recordings
+
+    async def get_pending_recordings(self, cv_user_id: str, language: str) -> list[dict]:
+        """Get all pending recordings for active sentences."""
+        return await self._get_recordings_by_status(cv_user_id, language, "pending")
 
     async def get_failed_recordings(self, cv_user_id: str, language: str) -> list[dict]:
         """Get all failed recordings for active sentences."""
-        sentences = await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .select("*")
-                .eq("cv_user_id", cv_user_id)
-                .eq("language", language)
-                .eq("status", "active")
-                .order("sentence_number")
-                .execute()
-        )
-        
-        if not sentences.data:
-            return []
-        
-        sentence_ids = [s["id"] for s in sentences.data]
-        recordings = await asyncio.to_thread(
-            lambda: self.client.table("recordings")
-                .select("*")
-                .in_("sentence_id", sentence_ids)
-                .eq("status", "failed")
-                .execute()
-        )
-        
-        recording_map = {r["sentence_id"]: r for r in recordings.data}
-        result = []
-        for s in sentences.data:
-            r = recording_map.get(s["id"])
-            if r:
-                result.append({
-                    **r,
-                    "sentence_number": s["sentence_number"],
-                    "text_id": s["text_id"],
-                    "text": s["text"],
-                    "hash": s["hash"],
-                })
-        return result
-
-    async def update_recording_status(
-        self,
-        sentence_id: int,
-        status: str,
-        error_message: Optional[str] = None,
-    ) -> None:
-        """Update recording status."""
-        now = self._now()
-        data = {"status": status}
-        
-        if status == "uploaded":
-            data["error_message"] = None
-            data["uploaded_at"] = now
-        else:
-            data["error_message"] = error_message
+        return await self._get_recordings_by_status(cv_user_id, language, "failed")
+
+    async def mark_recording_failed(self, sentence_id: int, error_message: str) -> None:
+        """Mark a recording as failed with the upload error.
         
-        await asyncio.to_thread(
-            lambda: self.client.table("recordings")
-                .update(data)
+        Successful uploads go through mark_recording_uploaded, which also updates the sentence.
+        """
+        await (
+            self.client.table("recordings")
+                .update({"status": "failed", "error_message": error_message})
                 .eq("sentence_id", sentence_id)
                 .execute()
         )
 
+    async def mark_recording_uploaded(self, sentence_id: int) -> None:
+        """Mark a recording and its sentence as uploaded (one transaction, one round-trip)."""
+        await self.client.rpc("mark_recording_uploaded", {"p_sentence_id": sentence_id}).execute()
+
     async def get_recording_stats(self, cv_user_id: str, language: str) -> dict:
-        """Get comprehensive stats for all sentences in this language."""
-        # Get all sentences grouped by status
-        sentences = await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .select("id, status")
-                .eq("cv_user_id", cv_user_id)
-                .eq("language", language)
-                .execute()
-        )
-        
-        stats = {
-            "total": len(sentences.data),
-            "active": 0,      # Sentences waiting to be recorded
-            "uploaded": 0,    # Sentences successfully uploaded
-            "skipped": 0,     # Sentences skipped by user
-            "pending": 0,     # Recordings waiting to upload
-            "failed": 0,      # Recordings that failed
-        }
-        
-        if not sentences.data:
-            return stats
-        
-        # Count by sentence status
-        active_ids = []
-        for s in sentences.data:
-            if s["status"] == "active":
-                stats["active"] += 1
-                active_ids.append(s["id"])
-            elif s["status"] == "uploaded":
-                stats["uploaded"] += 1
-            elif s["status"] == "skipped":
-                stats["skipped"] += 1
+        """Get comprehensive stats for all sentences in this language.
         
-        # Get pending/failed recordings for active sentences
-        if active_ids:
-            recordings = await asyncio.to_thread(
-                lambda: self.client.table("recordings")
-                    .select("status")
-                    .in_("sentence_id", active_ids)
-                    .execute()
-            )
-            
-            for row in recordings.data:
-                if row["status"] == "pending":
-                    stats["pending"] += 1
-                elif row["status"] == "failed":
-                    stats["failed"] += 1
+        Counts are aggregated server-side and returned as a single row.
+        """
+        result = await self.client.rpc("recording_stats", {
+            "p_cv_user_id": cv_user_id,
+            "p_language": language,
+        }).execute()
+        row = result.data[0] if result.data else {}
         
-        return stats
+        return {
+            "total": row.get("total") or 0,
+            "active": row.get("active") or 0,      # Sentences waiting to be recorded
+            "uploaded": row.get("uploaded") or 0,  # Sentences successfully uploaded
+            "skipped": row.get("skipped") or 0,    # Sentences skipped by user
+            "pending": row.get("pending") or 0,    # Recordings waiting to upload
+            "failed": row.get("failed") or 0,      # Recordings that failed
+        }
 
     async def get_all_recordings_with_sentences(self, cv_user_id: str, language: str) -> list[dict]:
         """Get all active sentences with their recording status."""
-        sentences = await asyncio.to_thread(
-            lambda: self.client.table("sentences")
-                .select("*")
+        # Left-join recordings onto sentences server-side (one round-trip)
+        result = await (
+            self.client.table("sentences")
+                .select(f"{_SENTENCE_COLUMNS}, recordings({_RECORDING_COLUMNS})")
                 .eq("cv_user_id", cv_user_id)
                 .eq("language", language)
                 .eq("status", "active")
@@ -496,27 +441,14 @@ class Database:
                 .execute()
         )
         
-        if not sentences.data:
-            return []
-        
-        sentence_ids = [s["id"] for s in sentences.data]
-        recordings = await asyncio.to_thread(
-            lambda: self.client.table("recordings")
-                .select("*")
-                .in_("sentence_id", sentence_ids)
-                .execute()
-        )
-        
-        recording_map = {r["sentence_id"]: r for r in recordings.data}
-        result = []
-        for s in sentences.data:
-            r = recording_map.get(s["id"])
-            result.append({
+        return [
+            {
                 "sentence_id": s["id"],
                 "sentence_number": s["sentence_number"],
                 "text_id": s["text_id"],
                 "text": s["text"],
                 "hash": s["hash"],
-                "recording": r,
-            })
-        return result
+                "recording": _embedded_recording(s),
+            }
+            for s in result.data
+        ]
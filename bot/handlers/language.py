@@ -17,16 +17,21 @@ from bot.handlers.registry import handler
 # Conversation state
 SELECTING = 0
 
+# Keyboard and button lookup never change, so build them once
+LANGUAGE_BUTTONS = {f"{name} ({code})": code for code, name in BOT_LANGUAGES.items()}
+LANGUAGE_BUTTON_CODES = {button.lower(): code for button, code in LANGUAGE_BUTTONS.items()}
+LANGUAGE_KEYBOARD = ReplyKeyboardMarkup(
+    [[button] for button in LANGUAGE_BUTTONS],
+    one_time_keyboard=True,
+    resize_keyboard=True,
+)
+
 
 async def language_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Start the language selection conversation."""
-    # Create keyboard with language options
-    keyboard = [[f"{name} ({code})"] for code, name in BOT_LANGUAGES.items()]
-    reply_markup = ReplyKeyboardMarkup(keyboard, one_time_keyboard=True, resize_keyboard=True)
-
     await update.message.reply_text(
         "🌐 Choose your language / Elige tu idioma:",
-        reply_markup=reply_markup,
+        reply_markup=LANGUAGE_KEYBOARD,
     )
     return SELECTING
 
@@ -38,19 +43,18 @@ async def receive_language(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     text = update.message.text.strip().lower()
     telegram_id = update.effective_user.id
     
-    # Extract language code from selection
-    selected_code = None
-    for code, name in BOT_LANGUAGES.items():
-        if code in text or name.lower() in text:
-            selected_code = code
-            break
+    # Extract language code from selection (keyboard button first, then typed text)
+    selected_code = LANGUAGE_BUTTON_CODES.get(text)
+    if not selected_code:
+        for code, name in BOT_LANGUAGES.items():
+            if code in text or name.lower() in text:
+                selected_code = code
+                break
     
     if not selected_code:
-        keyboard = [[f"{name} ({code})"] for code, name in BOT_LANGUAGES.items()]
-        reply_markup = ReplyKeyboardMarkup(keyboard, one_time_keyboard=True, resize_keyboard=True)
         await update.message.reply_text(
             "Please select a valid language / Por favor selecciona un idioma válido:",
-            reply_markup=reply_markup,
+            reply_markup=LANGUAGE_KEYBOARD,
         )
         return SELECTING
     
@@ -1,7 +1,5 @@
 """Login conversation handler."""
 
-import os
-
 from telegram import Update, ReplyKeyboardRemove
 from telegram.ext import (
     ContextTypes,
@@ -11,7 +9,6 @@ from telegram.ext import (
     filters,
 )
 
-from bot.config import Config
 from bot.database.db import Database
 from bot.services.cv_api import CVAPIClient, CVAPIError
 from bot.i18n import t
@@ -22,30 +19,12 @@ from bot.handlers.registry import handler
 EMAIL, USERNAME = range(2)
 
 
-def _get_api_client(config: Config) -> CVAPIClient:
-    """Create API client with admin credentials from environment."""
-    client_id = os.getenv("CV_CLIENT_ID")
-    client_secret = os.getenv("CV_CLIENT_SECRET")
-    
-    if not client_id or not client_secret:
-        raise ValueError("CV_CLIENT_ID and CV_CLIENT_SECRET must be set in .env")
-    
-    return CVAPIClient(
-        client_id=client_id,
-        client_secret=client_secret,
-        base_url=config.cv_api_base_url,
-        token_expiry_buffer_seconds=config.token_expiry_buffer_seconds,
-    )
-
-
 async def login_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Start the login conversation."""
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
-    lang = await db.get_bot_language(telegram_id)
-    
     # Check if already logged in (has token)
-    user = await db.get_user(telegram_id)
+    lang, user = await db.get_language_and_user(telegram_id)
     if user and user.get("cv_token"):
         await update.message.reply_text(
             t(lang, "already_logged_in", username=user['username']),
@@ -89,7 +68,6 @@ async def receive_username(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     2. Username exists, email match  → re-login (claim the account)
     3. Username exists, email mismatch → reject ("taken")
     """
-    config: Config = context.bot_data["config"]
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
     lang = await db.get_bot_language(telegram_id)
@@ -131,7 +109,7 @@ async def receive_username(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     # Username doesn't exist — create a new CV account
     await update.message.reply_text(t(lang, "login_creating"))
 
-    api_client = _get_api_client(config)
+    api_client: CVAPIClient = context.bot_data["cv_api"]
     try:
         user_info = await api_client.create_user(email, username)
         cv_user_id = user_info.get("userId")
@@ -144,8 +122,6 @@ async def receive_username(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             t(lang, "login_failed", error=e.detail or e.message)
         )
         return ConversationHandler.END
-    finally:
-        await api_client.close()
 
     await db.save_user(
         telegram_id=telegram_id,
@@ -1,7 +1,6 @@
 """Voice recording handlers."""
 
 import logging
-import os
 import re
 
 logger = logging.getLogger(__name__)
@@ -9,7 +8,6 @@ logger = logging.getLogger(__name__)
 from telegram import Update
 from telegram.ext import ContextTypes, MessageHandler, filters
 
-from bot.config import Config
 from bot.database.db import Database
 from bot.services.cv_api import CVAPIClient, CVAPIError
 from bot.i18n import t, get_all_skip_words
@@ -20,30 +18,12 @@ from bot.handlers.registry import handler
 SENTENCE_PATTERN = re.compile(r"#(\d+)")
 
 
-def _get_api_client(config: Config) -> CVAPIClient:
-    """Create API client with admin credentials from environment."""
-    client_id = os.getenv("CV_CLIENT_ID")
-    client_secret = os.getenv("CV_CLIENT_SECRET")
-    
-    if not client_id or not client_secret:
-        raise ValueError("CV_CLIENT_ID and CV_CLIENT_SECRET must be set in .env")
-    
-    return CVAPIClient(
-        client_id=client_id,
-        client_secret=client_secret,
-        base_url=config.cv_api_base_url,
-        token_expiry_buffer_seconds=config.token_expiry_buffer_seconds,
-    )
-
-
 async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle incoming voice messages."""
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
-    lang = await db.get_bot_language(telegram_id)
-    
     # Check if user is registered
-    user = await db.get_user(telegram_id)
+    lang, user = await db.get_language_and_user(telegram_id)
     if not user:
         await update.message.reply_text(t(lang, "record_not_registered"))
         return
@@ -106,15 +86,14 @@ async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYP
 
     await db.save_recording(sentence["id"], voice.file_id, storage_path=storage_path)
     
-    # Get stats
+    # Get stats (stats["total"] already counts every sentence in this language)
     stats = await db.get_recording_stats(cv_user_id, current_language)
-    total_sentences = await db.get_sentence_count(cv_user_id, current_language)
     
     await update.message.reply_text(
         t(lang, "record_success",
           number=sentence_number,
-          recorded=stats['total'],
-          total=total_sentences,
+          recorded=stats['uploaded'] + stats['pending'] + stats['failed'],
+          total=stats['total'],
           pending=stats['pending'],
           uploaded=stats['uploaded'])
     )
@@ -224,7 +203,6 @@ async def attempt_upload(
     lang: str,
 ) -> None:
     """Attempt to upload a recording immediately."""
-    config: Config = context.bot_data["config"]
     db: Database = context.bot_data["db"]
     
     cv_user_id = user["cv_user_id"]
@@ -242,33 +220,27 @@ async def attempt_upload(
         audio_bytes = await audio_file.download_as_bytearray()
         
         # Upload to Common Voice using admin credentials
-        api_client = _get_api_client(config)
-        try:
-            await api_client.upload_audio(
-                audio_data=bytes(audio_bytes),
-                user_id=cv_user_id,
-                dataset_code=current_language,
-                text_id=sentence["text_id"],
-                text=sentence["text"],
-                text_hash=sentence["hash"],
-                age=user.get("age"),
-                gender=user.get("gender"),
-            )
-            
-            # Mark as uploaded
-            await db.update_recording_status(sentence_id, "uploaded")
-            await db.mark_sentence_uploaded(sentence_id)
-            
-            await update.message.reply_text(
-                t(lang, "record_uploaded", number=sentence["sentence_number"])
-            )
-        finally:
-            await api_client.close()
+        api_client: CVAPIClient = context.bot_data["cv_api"]
+        await api_client.upload_audio(
+            audio_data=bytes(audio_bytes),
+            user_id=cv_user_id,
+            dataset_code=current_language,
+            text_id=sentence["text_id"],
+            text=sentence["text"],
+            text_hash=sentence["hash"],
+            age=user.get("age"),
+            gender=user.get("gender"),
+        )
+        
+        # Mark as uploaded
+        await db.mark_recording_uploaded(sentence_id)
+        
+        await update.message.reply_text(
+            t(lang, "record_uploaded", number=sentence["sentence_number"])
+        )
             
     except CVAPIError as e:
-        await db.update_recording_status(
-            sentence_id, "failed", error_message=str(e.detail or e.message)
-        )
+        await db.mark_recording_failed(sentence_id, str(e.detail or e.message))
     except Exception:
         # Network error, keep as pending
         pass
@@ -1,6 +1,6 @@
 """Setup conversation handler for language selection and sentence fetching."""
 
-import os
+import re
 import asyncio
 import logging
 
@@ -24,6 +24,9 @@ logger = logging.getLogger(__name__)
 # Conversation states
 LANGUAGE, AGE, GENDER, SENTENCE_COUNT = range(4)
 
+# Language keyboard buttons end in "(code)"
+LANGUAGE_CODE_PATTERN = re.compile(r"\(([^()]+)\)\s*$")
+
 # Age range options (API value -> translation key)
 AGE_OPTIONS = [
     ("teens", "age_teens"),
@@ -46,30 +49,12 @@ GENDER_OPTIONS = [
 ]
 
 
-def _get_api_client(config: Config) -> CVAPIClient:
-    """Create API client with admin credentials from environment."""
-    client_id = os.getenv("CV_CLIENT_ID")
-    client_secret = os.getenv("CV_CLIENT_SECRET")
-    
-    if not client_id or not client_secret:
-        raise ValueError("CV_CLIENT_ID and CV_CLIENT_SECRET must be set in .env")
-    
-    return CVAPIClient(
-        client_id=client_id,
-        client_secret=client_secret,
-        base_url=config.cv_api_base_url,
-        token_expiry_buffer_seconds=config.token_expiry_buffer_seconds,
-    )
-
-
 async def setup_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Start the setup conversation."""
     config: Config = context.bot_data["config"]
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
-    lang = await db.get_bot_language(telegram_id)
-    
-    user = await db.get_user(telegram_id)
+    lang, user = await db.get_language_and_user(telegram_id)
     if not user:
         await update.message.reply_text(t(lang, "setup_not_registered"))
         return ConversationHandler.END
@@ -94,12 +79,16 @@ async def receive_language(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     
     text = update.message.text.strip()
     
-    # Extract language code from selection
+    # Extract language code from selection (keyboard button first, then typed text)
     selected_code = None
-    for code, name in config.supported_languages.items():
-        if code in text.lower() or name.lower() in text.lower():
-            selected_code = code
-            break
+    match = LANGUAGE_CODE_PATTERN.search(text)
+    if match and match.group(1) in config.supported_codes:
+        selected_code = match.group(1)
+    else:
+        for code, name in config.supported_languages.items():
+            if code in text.lower() or name.lower() in text.lower():
+                selected_code = code
+                break
     
     if not selected_code:
         keyboard = [[f"{name} ({code})"] for code, name in config.supported_languages.items()]
@@ -254,7 +243,7 @@ async def receive_sentence_count(update: Update, context: ContextTypes.DEFAULT_T
     seen_ids = await db.get_seen_sentence_ids(cv_user_id, cv_language)
     
     # Fetch sentences from API using admin credentials
-    api_client = _get_api_client(config)
+    api_client: CVAPIClient = context.bot_data["cv_api"]
     try:
         sentences = await api_client.get_sentences(
             cv_language, 
@@ -273,20 +262,21 @@ async def receive_sentence_count(update: Update, context: ContextTypes.DEFAULT_T
             t(lang, "setup_fetch_failed", error=e.detail or e.message)
         )
         return ConversationHandler.END
-    finally:
-        await api_client.close()
     
-    # Save demographics (non-critical - don't fail setup if this errors)
+    # Save demographics if changed (non-critical - don't fail setup if this errors)
     setup_age = context.user_data.get("setup_age")
     setup_gender = context.user_data.get("setup_gender")
-    try:
-        await db.update_user_demographics(telegram_id, setup_age, setup_gender)
-    except Exception as e:
-        logger.warning(f"Failed to save demographics for {telegram_id}: {e}")
-    
-    # Set current language and save sentences
-    await db.set_current_language(telegram_id, cv_language)
-    await db.save_sentences(cv_user_id, cv_language, sentences)
+    if (setup_age, setup_gender) != (user.get("age"), user.get("gender")):
+        try:
+            await db.update_user_demographics(telegram_id, setup_age, setup_gender)
+        except Exception as e:
+            logger.warning(f"Failed to save demographics for {telegram_id}: {e}")
+    
+    # Set current language (if changed) and save sentences (independent, so run concurrently)
+    writes = [db.save_sentences(cv_user_id, cv_language, sentences)]
+    if user.get("current_language") != cv_language:
+        writes.append(db.set_current_language(telegram_id, cv_language))
+    await asyncio.gather(*writes)
     
     # Clear setup data
     context.user_data.pop("setup_language", None)
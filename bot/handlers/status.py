@@ -1,6 +1,5 @@
 """Status and management command handlers."""
 
-import os
 import re
 import asyncio
 
@@ -34,30 +33,12 @@ def parse_sentence_numbers(text: str, max_num: int) -> list[int]:
     return sorted(numbers)
 
 
-def _get_api_client(config: Config) -> CVAPIClient:
-    """Create API client with admin credentials from environment."""
-    client_id = os.getenv("CV_CLIENT_ID")
-    client_secret = os.getenv("CV_CLIENT_SECRET")
-    
-    if not client_id or not client_secret:
-        raise ValueError("CV_CLIENT_ID and CV_CLIENT_SECRET must be set in .env")
-    
-    return CVAPIClient(
-        client_id=client_id,
-        client_secret=client_secret,
-        base_url=config.cv_api_base_url,
-        token_expiry_buffer_seconds=config.token_expiry_buffer_seconds,
-    )
-
-
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show current status and recording progress."""
     config: Config = context.bot_data["config"]
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
-    lang = await db.get_bot_language(telegram_id)
-    
-    user = await db.get_user(telegram_id)
+    lang, user = await db.get_language_and_user(telegram_id)
     
     if not user:
         await update.message.reply_text(t(lang, "status_not_registered"))
@@ -113,9 +94,7 @@ async def sentences_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     """Show sentences for the current session."""
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
-    lang = await db.get_bot_language(telegram_id)
-    
-    user = await db.get_user(telegram_id)
+    lang, user = await db.get_language_and_user(telegram_id)
     if not user or not user.get("current_language"):
         await update.message.reply_text(t(lang, "sentences_no_session"))
         return
@@ -127,8 +106,7 @@ async def sentences_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     sentence_data = await db.get_all_recordings_with_sentences(cv_user_id, current_language)
     if not sentence_data:
         # Check if there are any sentences at all (uploaded/skipped)
-        total = await db.get_sentence_count(cv_user_id, current_language)
-        if total > 0:
+        if await db.has_sentences(cv_user_id, current_language):
             await update.message.reply_text(t(lang, "sentences_all_done"))
         else:
             await update.message.reply_text(t(lang, "sentences_none"))
@@ -183,12 +161,9 @@ async def sentences_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 async def upload_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Manually trigger upload of pending recordings."""
-    config: Config = context.bot_data["config"]
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
-    lang = await db.get_bot_language(telegram_id)
-    
-    user = await db.get_user(telegram_id)
+    lang, user = await db.get_language_and_user(telegram_id)
     if not user:
         await update.message.reply_text(t(lang, "upload_not_registered"))
         return
@@ -213,49 +188,37 @@ async def upload_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         t(lang, "upload_starting", count=len(all_recordings))
     )
     
-    api_client = _get_api_client(config)
+    api_client: CVAPIClient = context.bot_data["cv_api"]
     
     success_count = 0
     fail_count = 0
     
-    try:
-        for rec in all_recordings:
-            try:
-                audio_file = await context.bot.get_file(rec["file_id"])
-                audio_bytes = await audio_file.download_as_bytearray()
-                
-                await api_client.upload_audio(
-                    audio_data=bytes(audio_bytes),
-                    user_id=cv_user_id,
-                    dataset_code=current_language,
-                    text_id=rec["text_id"],
-                    text=rec["text"],
-                    text_hash=rec["hash"],
-                    age=user.get("age"),
-                    gender=user.get("gender"),
-                )
-                
-                await db.update_recording_status(rec["sentence_id"], "uploaded")
-                await db.mark_sentence_uploaded(rec["sentence_id"])
-                
-                success_count += 1
-                
-            except CVAPIError as e:
-                await db.update_recording_status(
-                    rec["sentence_id"], 
-                    "failed",
-                    error_message=str(e.detail or e.message)
-                )
-                fail_count += 1
-            except Exception as e:
-                await db.update_recording_status(
-                    rec["sentence_id"],
-                    "failed",
-                    error_message=str(e)
-                )
-                fail_count += 1
-    finally:
-        await api_client.close()
+    for rec in all_recordings:
+        try:
+            audio_file = await context.bot.get_file(rec["file_id"])
+            audio_bytes = await audio_file.download_as_bytearray()
+            
+            await api_client.upload_audio(
+                audio_data=bytes(audio_bytes),
+                user_id=cv_user_id,
+                dataset_code=current_language,
+                text_id=rec["text_id"],
+                text=rec["text"],
+                text_hash=rec["hash"],
+                age=user.get("age"),
+                gender=user.get("gender"),
+            )
+            
+            await db.mark_recording_uploaded(rec["sentence_id"])
+            
+            success_count += 1
+            
+        except CVAPIError as e:
+            await db.mark_recording_failed(rec["sentence_id"], str(e.detail or e.message))
+            fail_count += 1
+        except Exception as e:
+            await db.mark_recording_failed(rec["sentence_id"], str(e))
+            fail_count += 1
     
     if fail_count == 0:
         await update.message.reply_text(
@@ -271,9 +234,7 @@ async def skip_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     """Skip sentences so they won't be assigned again."""
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
-    lang = await db.get_bot_language(telegram_id)
-    
-    user = await db.get_user(telegram_id)
+    lang, user = await db.get_language_and_user(telegram_id)
     if not user or not user.get("current_language"):
         await update.message.reply_text(t(lang, "skip_no_session"))
         return
@@ -301,12 +262,7 @@ async def skip_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         )
         return
     
-    skipped = []
-    for num in numbers:
-        sentence = await db.get_sentence_by_number(cv_user_id, current_language, num)
-        if sentence:
-            await db.mark_sentence_skipped(sentence["id"])
-            skipped.append(num)
+    skipped = await db.mark_sentences_skipped(cv_user_id, current_language, numbers)
     
     if skipped:
         await update.message.reply_text(
@@ -320,9 +276,7 @@ async def logout_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     """Log out and clear session data (keeps user record for history)."""
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
-    lang = await db.get_bot_language(telegram_id)
-    
-    user = await db.get_user(telegram_id)
+    lang, user = await db.get_language_and_user(telegram_id)
     
     if not user:
         await update.message.reply_text(t(lang, "logout_not_registered"))
@@ -356,9 +310,7 @@ async def resend_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     """Resend unrecorded sentences as individual messages for offline recording."""
     db: Database = context.bot_data["db"]
     telegram_id = update.effective_user.id
-    lang = await db.get_bot_language(telegram_id)
-    
-    user = await db.get_user(telegram_id)
+    lang, user = await db.get_language_and_user(telegram_id)
     if not user or not user.get("current_language"):
         await update.message.reply_text(t(lang, "resend_no_session"))
         return
@@ -7,6 +7,7 @@ from telegram.ext import Application, PicklePersistence
 
 from bot.config import load_config, DATA_DIR
 from bot.database.db import Database
+from bot.services.cv_api import CVAPIClient
 from bot.handlers import register_all
 
 
@@ -17,40 +18,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Load configuration at module level
-_config = None
-
-
-def get_config():
-    """Get or load configuration."""
-    global _config
-    if _config is None:
-        _config = load_config()
-    return _config
-
 
 async def post_init(application: Application) -> None:
     """Initialize services after application starts."""
     logger.info("Initializing services...")
     
     # Load config (persistence may have cleared bot_data)
-    config = get_config()
-    application.bot_data["config"] = config
+    application.bot_data["config"] = load_config()
     
     # Initialize database (Supabase)
     db = Database()
     await db.init()
     application.bot_data["db"] = db
     
+    # Shared Common Voice API client (admin credentials): keeps its token
+    # and HTTP connections across handlers instead of one per request
+    config = application.bot_data["config"]
+    application.bot_data["cv_api"] = CVAPIClient(
+        client_id=os.getenv("CV_CLIENT_ID"),
+        client_secret=os.getenv("CV_CLIENT_SECRET"),
+        base_url=config.cv_api_base_url,
+        token_expiry_buffer_seconds=config.token_expiry_buffer_seconds,
+    )
+    
     logger.info("Services initialized.")
 
 
+async def post_shutdown(application: Application) -> None:
+    """Release services before the application exits."""
+    db: Database = application.bot_data.get("db")
+    if db:
+        try:
+            await db.close()
+        except Exception as e:
+            logger.warning(f"Failed to close database: {e}")
+    
+    api_client: CVAPIClient = application.bot_data.get("cv_api")
+    if api_client:
+        try:
+            await api_client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close Common Voice API client: {e}")
+
+
 def main() -> None:
     """Run the bot."""
     logger.info("Starting Common Voice Offline Bot...")
     
     # Load configuration early to validate
-    config = get_config()
+    load_config()
     
     # Use --dev flag to run with the dev bot token for local testing
     dev_mode = "--dev" in os.sys.argv
@@ -81,6 +97,7 @@ def main() -> None:
         .token(bot_token)
         .persistence(persistence)
         .post_init(post_init)
+        .post_shutdown(post_shutdown)
         .build()
     )
     
@@ -1,5 +1,6 @@
 -- Common Voice Offline Bot - Supabase Schema
 -- Paste this into Supabase SQL Editor and run it
+-- Safe to re-run on an existing database to pick up new indexes and functions
 --
 -- IMPORTANT: Also create a Storage bucket named "recordings" in the Supabase dashboard:
 --   Storage → New Bucket → Name: "recordings" → Private (not public)
@@ -10,7 +11,7 @@
 
 -- Users table: each row is a CV account. A telegram_id can own multiple
 -- accounts but only one is active (cv_token = 'active') at a time.
-CREATE TABLE users (
+CREATE TABLE IF NOT EXISTS users (
     id BIGSERIAL PRIMARY KEY,
     telegram_id BIGINT NOT NULL,
     cv_user_id TEXT NOT NULL,
@@ -25,7 +26,7 @@ CREATE TABLE users (
 );
 
 -- Sentences table: all sentences ever assigned (merged with seen_sentences)
-CREATE TABLE sentences (
+CREATE TABLE IF NOT EXISTS sentences (
     id BIGSERIAL PRIMARY KEY,
     cv_user_id TEXT NOT NULL,
     language TEXT NOT NULL,
@@ -38,7 +39,7 @@ CREATE TABLE sentences (
 );
 
 -- Recordings table: tracks voice recordings for each sentence
-CREATE TABLE recordings (
+CREATE TABLE IF NOT EXISTS recordings (
     id BIGSERIAL PRIMARY KEY,
     sentence_id BIGINT NOT NULL REFERENCES sentences(id) ON DELETE CASCADE,
     file_id TEXT NOT NULL,
@@ -51,7 +52,7 @@ CREATE TABLE recordings (
 );
 
 -- User preferences table: for non-registered users (bot language preference)
-CREATE TABLE user_preferences (
+CREATE TABLE IF NOT EXISTS user_preferences (
     telegram_id BIGINT PRIMARY KEY,
     bot_language TEXT NOT NULL DEFAULT 'es',
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
@@ -61,13 +62,181 @@ CREATE TABLE user_preferences (
 -- INDEXES
 -- ============================================
 
-CREATE UNIQUE INDEX idx_users_username ON users(username);
-CREATE INDEX idx_users_telegram_id ON users(telegram_id);
-CREATE INDEX idx_sentences_cv_user_id ON sentences(cv_user_id);
-CREATE INDEX idx_sentences_cv_user_language ON sentences(cv_user_id, language);
-CREATE INDEX idx_sentences_status ON sentences(status);
-CREATE INDEX idx_recordings_sentence_id ON recordings(sentence_id);
-CREATE INDEX idx_recordings_status ON recordings(status);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_username ON users(username);
+CREATE INDEX IF NOT EXISTS idx_users_telegram_id ON users(telegram_id);
+-- Superseded by idx_sentences_user_lang_status_number (they are its leading prefix)
+DROP INDEX IF EXISTS idx_sentences_cv_user_id;
+DROP INDEX IF EXISTS idx_sentences_cv_user_language;
+CREATE INDEX IF NOT EXISTS idx_sentences_status ON sentences(status);
+-- Serves the active-session lookups: by number, by status, ordered by number
+CREATE INDEX IF NOT EXISTS idx_sentences_user_lang_status_number ON sentences(cv_user_id, language, status, sentence_number);
+-- Serves seen_sentence_ids() as an index-only scan over a user's history
+CREATE INDEX IF NOT EXISTS idx_sentences_seen ON sentences(cv_user_id, language) INCLUDE (text_id)
+    WHERE status IN ('uploaded', 'skipped');
+-- get_user() looks up the active account on nearly every message
+CREATE INDEX IF NOT EXISTS idx_users_telegram_id_active ON users(telegram_id) WHERE cv_token = 'active';
+CREATE INDEX IF NOT EXISTS idx_recordings_sentence_id ON recordings(sentence_id);
+CREATE INDEX IF NOT EXISTS idx_recordings_status ON recordings(status);
+
+-- ============================================
+-- TRIGGERS
+-- ============================================
+
+-- Stamp updated_at on every UPDATE so writers don't have to send it
+CREATE OR REPLACE FUNCTION set_updated_at()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS users_set_updated_at ON users;
+CREATE TRIGGER users_set_updated_at
+    BEFORE UPDATE ON users
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS user_preferences_set_updated_at ON user_preferences;
+CREATE TRIGGER user_preferences_set_updated_at
+    BEFORE UPDATE ON user_preferences
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+-- Stamp recording times server-side: created_at when a sentence is
+-- re-recorded (upsert replaces file_id), uploaded_at when it reaches 'uploaded'
+CREATE OR REPLACE FUNCTION set_recording_timestamps()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.file_id IS DISTINCT FROM OLD.file_id THEN
+        NEW.created_at = NOW();
+    END IF;
+    IF NEW.status = 'uploaded' AND (TG_OP = 'INSERT' OR OLD.status IS DISTINCT FROM 'uploaded') THEN
+        NEW.uploaded_at = NOW();
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS recordings_set_timestamps ON recordings;
+CREATE TRIGGER recordings_set_timestamps
+    BEFORE INSERT OR UPDATE ON recordings
+    FOR EACH ROW EXECUTE FUNCTION set_recording_timestamps();
+
+-- ============================================
+-- FUNCTIONS (called by the bot via RPC)
+-- ============================================
+
+-- Replace a user's active sentences with a new batch in one transaction
+CREATE OR REPLACE FUNCTION replace_active_sentences(
+    p_cv_user_id TEXT,
+    p_language TEXT,
+    p_sentences JSONB  -- [{sentence_number, text_id, text, hash}, ...]
+) RETURNS SETOF sentences
+LANGUAGE sql
+AS $$
+    DELETE FROM sentences WHERE cv_user_id = p_cv_user_id AND status = 'active';
+    INSERT INTO sentences (cv_user_id, language, sentence_number, text_id, text, hash)
+    SELECT p_cv_user_id, p_language, s.sentence_number, s.text_id, s.text, s.hash
+    FROM jsonb_to_recordset(p_sentences)
+        AS s(sentence_number INTEGER, text_id TEXT, text TEXT, hash TEXT)
+    RETURNING *;
+$$;
+
+-- Log in: deactivate the current active account and activate this one together
+CREATE OR REPLACE FUNCTION login_user(
+    p_telegram_id BIGINT,
+    p_cv_user_id TEXT,
+    p_email TEXT,
+    p_username TEXT
+) RETURNS void
+LANGUAGE sql
+AS $$
+    UPDATE users
+    SET cv_token = NULL, current_language = NULL
+    WHERE telegram_id = p_telegram_id AND cv_token = 'active';
+    INSERT INTO users (telegram_id, cv_user_id, email, username, cv_token)
+    VALUES (p_telegram_id, p_cv_user_id, p_email, p_username, 'active')
+    ON CONFLICT (username) DO UPDATE SET
+        telegram_id = EXCLUDED.telegram_id,
+        cv_user_id = EXCLUDED.cv_user_id,
+        email = EXCLUDED.email,
+        cv_token = EXCLUDED.cv_token;
+$$;
+
+-- Log out: drop the user's active sentences and deactivate the active account
+CREATE OR REPLACE FUNCTION logout_user(p_telegram_id BIGINT, p_cv_user_id TEXT)
+RETURNS void
+LANGUAGE sql
+AS $$
+    DELETE FROM sentences WHERE cv_user_id = p_cv_user_id AND status = 'active';
+    UPDATE users
+    SET cv_token = NULL, current_language = NULL
+    WHERE telegram_id = p_telegram_id AND cv_token = 'active';
+$$;
+
+-- Delete all accounts and preferences for a Telegram user
+CREATE OR REPLACE FUNCTION delete_user(p_telegram_id BIGINT)
+RETURNS void
+LANGUAGE sql
+AS $$
+    DELETE FROM user_preferences WHERE telegram_id = p_telegram_id;
+    DELETE FROM users WHERE telegram_id = p_telegram_id;
+$$;
+
+-- Mark a recording and its sentence as uploaded together
+CREATE OR REPLACE FUNCTION mark_recording_uploaded(p_sentence_id BIGINT)
+RETURNS void
+LANGUAGE sql
+AS $$
+    UPDATE recordings
+    SET status = 'uploaded', error_message = NULL
+    WHERE sentence_id = p_sentence_id;
+    UPDATE sentences SET status = 'uploaded' WHERE id = p_sentence_id;
+$$;
+
+-- Sentence and recording counts for one user's language, as a single row.
+-- pending/failed only count recordings on active sentences.
+CREATE OR REPLACE FUNCTION recording_stats(p_cv_user_id TEXT, p_language TEXT)
+RETURNS TABLE (total INT, active INT, uploaded INT, skipped INT, pending INT, failed INT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        COUNT(*)::INT,
+        COUNT(*) FILTER (WHERE s.status = 'active')::INT,
+        COUNT(*) FILTER (WHERE s.status = 'uploaded')::INT,
+        COUNT(*) FILTER (WHERE s.status = 'skipped')::INT,
+        COUNT(*) FILTER (WHERE s.status = 'active' AND r.status = 'pending')::INT,
+        COUNT(*) FILTER (WHERE s.status = 'active' AND r.status = 'failed')::INT
+    FROM sentences s
+    LEFT JOIN recordings r ON r.sentence_id = s.id
+    WHERE s.cv_user_id = p_cv_user_id AND s.language = p_language;
+$$;
+
+-- CV text ids a user already uploaded or skipped in a language, as one array.
+CREATE OR REPLACE FUNCTION seen_sentence_ids(p_cv_user_id TEXT, p_language TEXT)
+RETURNS TEXT[]
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(array_agg(text_id), '{}')
+    FROM sentences
+    WHERE cv_user_id = p_cv_user_id
+      AND language = p_language
+      AND status IN ('uploaded', 'skipped');
+$$;
+
+-- Bot-only functions: not callable with the dashboard's anon key
+REVOKE EXECUTE ON FUNCTION replace_active_sentences(TEXT, TEXT, JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION login_user(BIGINT, TEXT, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION logout_user(BIGINT, TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION delete_user(BIGINT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION mark_recording_uploaded(BIGINT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION recording_stats(TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION seen_sentence_ids(TEXT, TEXT) FROM PUBLIC, anon, authenticated;
 
 -- ============================================
 -- ROW LEVEL SECURITY (RLS)
@@ -86,7 +255,7 @@ ALTER TABLE user_preferences ENABLE ROW LEVEL SECURITY;
 -- ============================================
 
 -- Public user info (safe columns only - no tokens, emails, or telegram_id)
-CREATE VIEW public_users AS
+CREATE OR REPLACE VIEW public_users AS
 SELECT 
     cv_user_id,
     username,
@@ -94,7 +263,7 @@ SELECT
 FROM users;
 
 -- Aggregate stats by language (only counts successful uploads)
-CREATE VIEW stats_by_language AS
+CREATE OR REPLACE VIEW stats_by_language AS
 SELECT 
     language,
     COUNT(DISTINCT cv_user_id) FILTER (WHERE status = 'uploaded') as contributors,
@@ -103,7 +272,7 @@ FROM sentences
 GROUP BY language;
 
 -- User stats for personal dashboard
-CREATE VIEW user_stats AS
+CREATE OR REPLACE VIEW user_stats AS
 SELECT 
     cv_user_id,
     COUNT(*) FILTER (WHERE status = 'uploaded') as total_contributions,
@@ -112,7 +281,7 @@ FROM sentences
 GROUP BY cv_user_id;
 
 -- User sentences for personal dashboard (uploaded only)
-CREATE VIEW user_sentences AS
+CREATE OR REPLACE VIEW user_sentences AS
 SELECT 
     cv_user_id,
     language,